@@ -1,4 +1,5 @@
 import warnings
+from collections import defaultdict
 from datetime import datetime
 from typing import Union
 
@@ -183,6 +184,19 @@ class TestField:
             "ra": "1",
         }
 
+        class E(Schema):
+            # empty no_input / no_output: no mode is excluded, the field mode does not apply
+            ei: str = Field(mode="r", no_input="")
+            eo: str = Field(mode="r", no_output=[])
+
+        ei = E.__parser__.get_field("ei")
+        eo = E.__parser__.get_field("eo")
+        w = Options(mode="w")
+        assert ei.always_no_input(w) is False
+        assert ei.is_no_input("1", w) is False
+        assert eo.always_no_output(w) is False
+        assert eo.is_no_output("1", w) is False
+
         with pytest.raises(Exception):
 
             class T(Schema):  # noqa
@@ -529,6 +543,27 @@ class TestField:
         assert audio.file.tone == '1'
         assert audio.file.suffix == 'mp3'
 
+        audio = FileSchema(file={"name": "audio", "tone": 1})
+        assert isinstance(audio.file, Audio)
+
+        with pytest.raises(exc.ParseError):
+            FileSchema(file={"path": "/file"})
+
+        # the input mapping should not be mutated by __missing__
+        data = defaultdict(str, path="/file")
+        with pytest.raises(exc.ParseError):
+            FileSchema(file=data)
+        assert dict(data) == {"path": "/file"}
+
+        data = defaultdict(list, path="/file")
+        with pytest.raises(exc.ParseError):
+            FileSchema(file=data)
+        assert dict(data) == {"path": "/file"}
+
+        # unhashable discriminator value
+        with pytest.raises(exc.DiscriminatorMismatchError):
+            FileSchema(file={"name": ["video"], "path": "/file"})
+
         @parse(options=Options(data_first_search=dfs))
         def func(cls, file: Video | Audio = Field(discriminator='name')):
             assert isinstance(file, cls)
@@ -565,6 +565,48 @@ class TestFunc:
             'slug': 'big-shot'
         }
 
+    def test_param_config_warnings(self):
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter("always")
+
+            @utype.parse
+            def func(a: int = Field(default=1, no_output=True), b: int = Field(default=2, immutable=True)):
+                return a, b
+
+        messages = [str(w.message) for w in records]
+        # emitted per message, not joined into one
+        assert any(m.endswith("Field(name='a').no_output has no meanings in function params, "
+                              "please consider move it") for m in messages)
+        assert any(m.endswith("Field(name='b').immutable has no meanings in function params, "
+                              "please consider move it") for m in messages)
+        assert not any("\n" in m for m in messages)
+
+    def test_apply_for_no_cache(self):
+        from utype.parser.func import FunctionParser
+
+        def func(a: int):
+            return a
+
+        assert FunctionParser.apply_for(func).wrap(parse_params=True)('1') == 1
+        func.__annotations__['a'] = str
+        assert FunctionParser.apply_for(func, no_cache=True).wrap(parse_params=True)(1) == '1'
+
+    def test_apply_class_ignored(self):
+        from utype.parser.func import FunctionParser
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            @utype.parse(ignore_params=True, ignore_result=True)
+            class Api:
+                def get(self, a: int) -> str:
+                    return a
+
+        # methods are still wrapped with their parser attached
+        parser = FunctionParser.resolve_parser(Api.get)
+        assert isinstance(parser, FunctionParser)
+        assert Api().get('1') == '1'
+
     @pytest.mark.asyncio
     async def test_async(self, eager):
         import asyncio
@@ -1,3 +1,5 @@
+import json
+import pickle
 import uuid
 from collections.abc import Mapping
 from datetime import date, datetime, time, timedelta, timezone
@@ -8,11 +10,30 @@ from uuid import UUID
 import pytest
 
 import utype
-from utype import Options
+from utype import Options, exc
 from utype import TypeTransformer, register_transformer
 from utype.utils.encode import JSONEncoder, JSONSerializer
 from utype.utils.transform import DateFormat
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonSerializer(JSONSerializer):
+    prefer_orjson = True
+
+
+@pytest.fixture(params=(False, True))
+def serializer(request):
+    # run the encode tests on both the json and the orjson path
+    if request.param:
+        if not orjson:
+            pytest.skip("orjson is not installed")
+        return OrjsonSerializer()
+    return JSONSerializer()
+
 
 class TestType:
     def test_transform(self):
@@ -508,7 +529,7 @@ class TestType:
     def test_register(self):
         pass
 
-    def test_encode(self):
+    def test_encode(self, serializer):
         class en(Enum):
             c = 1
             d = 2
@@ -523,10 +544,100 @@ class TestType:
             'a': (1, 2),
             's': {'s'}
         }
-        res = JSONSerializer().dumps(data)
+        res = serializer.dumps(data)
         assert res == b'{"dt":"2000-01-01T12:13:14.001234","date":"2000-01-01",' \
                       b'"time":"12:13:14.001","dur":"P1DT00H00M10.000123S","dc":10.23,"en":2,"a":[1,2],"s":["s"]}'
 
+        # same output as json for the values orjson cannot encode itself
+        assert serializer.dumps([2 ** 70]) == b'[1180591620717411303424]'
+        assert serializer.dumps({'a': 1, (1, 2): 2}) == b'{"a":1}'
+        assert serializer.dumps({1: 'a'}) == b'{"1":"a"}'
+        assert serializer.dumps('测试') == '"测试"'.encode()
+
+        with pytest.raises(TypeError):
+            serializer.dumps(object())
+
+        mp = {'a': 1}
+        views = {
+            'fs': frozenset(['f']),
+            'keys': mp.keys(),
+            'values': mp.values(),
+            'items': mp.items(),
+            'range': range(3),
+        }
+        expected = b'{"fs":["f"],"keys":["a"],"values":[1],"items":[["a",1]],"range":[0,1,2]}'
+        assert serializer.dumps(views) == expected
+        assert json.dumps(views, cls=JSONEncoder, separators=(',', ':')).encode() == expected
+
+    def test_encode_orjson_opt_in(self):
+        assert not JSONSerializer().use_orjson()
+        if orjson:
+            assert OrjsonSerializer().use_orjson()
+            # documented difference of the opt-in orjson path
+            assert OrjsonSerializer().dumps([float('nan')]) == b'[null]'
+        assert JSONSerializer().dumps([float('nan')]) == b'[NaN]'
+
+    def test_error_pickle(self):
+        errors = [
+            exc.ParseError('invalid', item='a', value=1, type=int),
+            exc.DiscriminatorMismatchError(discriminator='name', discriminator_value='x', item='file'),
+            exc.CollectedParseError([exc.ParseError('invalid', item='a'), exc.ParseError('invalid', item='b')]),
+        ]
+        for error in errors:
+            loaded = pickle.loads(pickle.dumps(error))
+            assert type(loaded) is type(error)
+            assert str(loaded) == str(error)
+            assert loaded.item == error.item
+
+        loaded = pickle.loads(pickle.dumps(errors[1]))
+        assert loaded.discriminator == 'name'
+        assert loaded.discriminator_value == 'x'
+        loaded = pickle.loads(pickle.dumps(errors[2]))
+        assert [e.item for e in loaded.errors] == ['a', 'b']
+
+    def test_encode_late_register(self, serializer):
+        from utype.utils.encode import encoder_registry
+
+        class Foo:
+            pass
+
+        with pytest.raises(TypeError):
+            serializer.dumps(Foo())
+
+        encoder_registry.register(Foo)(lambda o: 'foo')
+        assert serializer.dumps([Foo()]) == b'["foo"]'
+
+        class Bar:
+            pass
+
+        with pytest.raises(TypeError):
+            serializer.dumps(Bar())
+        # the __encoder__ shortcut is looked up on every resolve
+        Bar.__encoder__ = lambda o: 'bar'
+        assert serializer.dumps([Bar()]) == b'["bar"]'
+
+    def test_encode_serializer_settings(self):
+        class Sub(JSONSerializer):
+            def __init__(self, charset):  # noqa, not calling super
+                self.charset = charset
+
+        assert Sub('utf-8').dumps({'a': [1]}) == b'{"a":[1]}'
+
+        serializer = JSONSerializer()
+        assert serializer.dumps({'a': 1}) == b'{"a":1}'
+        serializer.charset = 'latin-1'
+        serializer.separators = (', ', ': ')
+        assert serializer.dumps({'a': 1}) == b'{"a": 1}'
+
+    def test_encode_loads(self):
+        serializer = JSONSerializer()
+        big = 123456789012345678901234567890
+        assert serializer.loads(b'[123456789012345678901234567890]') == [big]
+        res = serializer.loads(b'[NaN,Infinity]')
+        assert res[0] != res[0]
+        assert res[1] == float('inf')
+        assert serializer.loads('{"测试":1}'.encode()) == {'测试': 1}
+
     # def test_vendor(self):
     #     from utype import register_transformer
     #     from collections.abc import Mapping
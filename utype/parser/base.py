@@ -54,7 +54,13 @@ class BaseParser:
         if not no_cache and key in __parsers__:
             cached: "BaseParser" = __parsers__[key]
             # if options is not identical, make a new one
-            if not options or options == cached.options:
+            # compare with the raw options as well, class / dict options
+            # are generated into a new Options instance by the parser
+            if (
+                not options
+                or options == cached.options
+                or options == cached.init_kwargs.get("options")
+            ):
                 return cached
         inst = cls(obj, options=options, **kwargs)      # noqa
         if not no_cache:
@@ -70,6 +76,7 @@ class BaseParser:
             str, Tuple[ForwardRef, dict]
         ] = {}  # store unresolved ref
         self.fields: Dict[str, ParserField] = {}
+        self.field_values: Tuple[ParserField, ...] = ()
         self.exclude_vars: Set[str] = set()
         # these data structures are designed to speed up the parsing
         self.case_insensitive_names: Set[str] = set()
@@ -95,6 +102,8 @@ class BaseParser:
         self.validate_fields()
         self.parse_addition_type()
         self.assign_search_strategy()
+        # fields are settled after setup, freeze them for the parsing loops
+        self.field_values = tuple(self.fields.values())
 
     def parse_addition_type(self):
         if self.options.addition and not isinstance(self.options.addition, bool):
@@ -463,7 +472,7 @@ class BaseParser:
 
         if not options.ignore_required:
             # if required field is ignored. we do not need to check for required fields
-            for key, field in self.fields.items():
+            for field in self.field_values:
                 name = field.attname if as_attname else field.name
                 if name in result:
                     continue
@@ -521,7 +530,7 @@ class BaseParser:
         unprovided_fields = set()
         options = context.options
 
-        for key, field in self.fields.items():
+        for field in self.field_values:
             value = unprovided
             name = field.attname if as_attname else field.name
 
@@ -1,14 +1,13 @@
 import inspect
 import warnings
 from collections.abc import Mapping
-from functools import partial
+from functools import lru_cache
 from types import FunctionType
-from typing import Callable, Dict, Type, TypeVar
+from typing import Callable, Dict, List, Type, TypeVar
 
 from ..utils import exceptions as exc
 from ..utils.compat import is_classvar, is_final
 from ..utils.datastructures import unprovided
-from ..utils.functional import pop
 from ..utils.transform import TypeTransformer
 from .base import BaseParser
 from .field import ParserField
@@ -20,6 +19,15 @@ T = TypeVar("T")
 __all__ = ["ClassParser", "init_dataclass"]
 
 
+@lru_cache(maxsize=4096)
+def is_qualified_member(name: str, qualname: str, attname: str, class_qualname: str = None):
+    # keys are only strings, so the cache does not hold the classes or attributes
+    if not class_qualname:
+        # loosely check
+        return attname == name and "." in qualname
+    return attname == name and qualname.startswith(f"{class_qualname}.")
+
+
 class ClassParser(BaseParser):
     # IGNORE_ATTR_TYPES = (staticmethod, classmethod, FunctionType, type)
     # if these type not having annotation, we will not recognize them as field
@@ -34,34 +42,60 @@ class ClassParser(BaseParser):
 
     def setup(self):
         self.generate_from_bases()
+        self.base_lookups = self.get_base_lookups()
         super().setup()
 
-    def validate_class_field_name(self, name: str):
-        if not self.validate_field_name(name):
-            return False
+    def get_base_lookups(self) -> list:
+        # resolve the annotations and the attribute names (across MRO) of every base once
+        # so that validate_class_field_names only need to getattr for the declared names
+        lookups = []
         for base in self.obj.__bases__:
             if base is object:
                 continue
-            annotations = getattr(base, "__annotations__", None)
+            names = set()
+            for b in base.__mro__:
+                names.update(b.__dict__)
+            lookups.append((base, getattr(base, "__annotations__", None), names))
+        return lookups
+
+    def validate_class_field_name(self, name: str):
+        return self.validate_class_field_names([name])[name]
+
+    def validate_class_field_names(self, names: List[str]) -> Dict[str, bool]:
+        # check the names against each base once, instead of walking the bases per name
+        result = {}
+        candidates = []
+        for name in names:
+            valid = self.validate_field_name(name)
+            result[name] = valid
+            if valid:
+                candidates.append(name)
+        if not candidates:
+            return result
+
+        for base, annotations, attrs in self.base_lookups:
             if annotations:
                 # maybe object
-                annotation = annotations.get(name)
-                if annotation:
-                    if is_final(annotation):
+                for name in candidates:
+                    annotation = annotations.get(name)
+                    if annotation and is_final(annotation):
                         raise TypeError(
                             f"field: {repr(name)} was declared as Final in {base}, "
                             f"so {self.obj} cannot annotate it again"
                         )
 
-            attr = getattr(base, name, None)
-            if self.is_class_internals(
-                attr, attname=name, class_qualname=base.__qualname__
-            ):
-                raise TypeError(
-                    f"field: {repr(name)} was declared in {base}, "
-                    f"so {self.obj} cannot annotate it as a field"
-                )
-        return True
+            for name in candidates:
+                if name not in attrs:
+                    continue
+                attr = getattr(base, name, None)
+                if self.is_class_internals(
+                    attr, attname=name, class_qualname=base.__qualname__
+                ):
+                    raise TypeError(
+                        f"field: {repr(name)} was declared in {base}, "
+                        f"so {self.obj} cannot annotate it as a field"
+                    )
+        return result
 
     @classmethod
     def is_class_internals(cls, attr, attname: str, class_qualname: str = None):
@@ -72,13 +106,8 @@ class ClassParser(BaseParser):
             return True
         qualname: str = getattr(attr, "__qualname__", None)
         name: str = getattr(attr, "__name__", None)
-        if name and qualname:
-            if not class_qualname:
-                # loosely check
-                return attname == name and "." in qualname
-
-            if attname == name and qualname.startswith(f"{class_qualname}."):
-                return True
+        if name and qualname and isinstance(name, str) and isinstance(qualname, str):
+            return is_qualified_member(name, qualname, attname, class_qualname)
         return False
 
     @property
@@ -101,21 +130,30 @@ class ClassParser(BaseParser):
         exclude_vars = self.exclude_vars
         fields = []
 
-        annotations = self.obj.__dict__.get("__annotations__", {})
+        obj_dict = self.obj.__dict__
+        annotations = obj_dict.get("__annotations__", {})
         # get annotations from __dict__
         # because if base has annotations and sub does not
         # it will directly use the annotations attr of base's
         global_vars = self.globals
+        generate = self.parser_field_cls.generate
+        forward_refs = self.forward_refs
+        options = self.options
+        force_clear_refs = self.is_local
+        kwargs = self.kwargs
+        obj_name = self.obj_name
+
+        valid_names = self.validate_class_field_names(list(annotations))
 
         for key, annotation in annotations.items():
             if (
-                not self.validate_class_field_name(key)
+                not valid_names[key]
                 or is_classvar(annotation)
                 # or is_final(annotation)
             ):
                 exclude_vars.add(key)
                 continue
-            default = self.obj.__dict__.get(key, unprovided)
+            default = obj_dict.get(key, unprovided)
             if annotation is None:
                 # a: None
                 # a: Optional[None]
@@ -123,26 +161,29 @@ class ClassParser(BaseParser):
                 annotation = type(None)
                 # to make a difference to annotation=None
             fields.append(
-                self.parser_field_cls.generate(
+                generate(
                     attname=key,
                     annotation=annotation,
                     default=default,
                     global_vars=global_vars,
-                    forward_refs=self.forward_refs,
-                    options=self.options,
-                    force_clear_refs=self.is_local,
-                    **self.kwargs
+                    forward_refs=forward_refs,
+                    options=options,
+                    force_clear_refs=force_clear_refs,
+                    **kwargs
                 )
             )
 
-        for key, attr in self.obj.__dict__.items():
+        for key, attr in obj_dict.items():
             if key in annotations:
                 continue
             if (
+                # cheap name check first, private names and dunders like __module__ / __doc__
+                # do not need the internals check
+                not self.validate_field_name(key)
                 # if this attr is a field in bases, this means to exclude this field in current class
                 # otherwise this attr declared that this field is never take from input
                 # or isinstance(attr, property)
-                self.is_class_internals(attr, attname=key, class_qualname=self.obj_name)
+                or self.is_class_internals(attr, attname=key, class_qualname=obj_name)
                 # or isinstance(attr, self.IGNORE_ATTR_TYPES)
                 # check class field name at last
                 # because this will check bases internals trying to find illegal override
@@ -163,15 +204,15 @@ class ClassParser(BaseParser):
                 self.fields.pop(key)
                 continue
             fields.append(
-                self.parser_field_cls.generate(
+                generate(
                     attname=key,
                     annotation=None,
                     default=attr,
                     global_vars=global_vars,
-                    forward_refs=self.forward_refs,
-                    options=self.options,
-                    force_clear_refs=self.is_local,
-                    **self.kwargs
+                    forward_refs=forward_refs,
+                    options=options,
+                    force_clear_refs=force_clear_refs,
+                    **kwargs
                 )
             )
 
@@ -194,91 +235,130 @@ class ClassParser(BaseParser):
         self.fields.update(field_map)
 
     def generate_from_bases(self):
-        fields = {}
-        alias_map = {}
-        attr_alias_map = {}
-        case_insensitive_names = set()
-        exclude_vars = set()
-        # option_list = []
-
-        for base in reversed(self.obj.__bases__):  # according to MRO
-            if not isinstance(base, type(self.obj)) or base is object:
-                continue
-            parser = self.apply_for(base)  # should use cache
-            # if not parser.options.vacuum:
-            #     option_list.append(parser.options)
+        # according to MRO, the latter (former in __bases__) parser override
+        parsers = [
+            self.apply_for(base)  # should use cache
+            for base in reversed(self.obj.__bases__)
+            if isinstance(base, type(self.obj)) and base is not object
+        ]
+
+        self.fields = {k: v for parser in parsers for k, v in parser.fields.items()}
+        self.exclude_vars = set().union(*(parser.exclude_vars for parser in parsers))
+        self.field_alias_map = {
+            k: v for parser in parsers for k, v in parser.field_alias_map.items()
+        }
+        self.attr_alias_map = {
+            k: v for parser in parsers for k, v in parser.attr_alias_map.items()
+        }
+        self.case_insensitive_names = set().union(
+            *(parser.case_insensitive_names for parser in parsers)
+        )
 
-            fields.update(parser.fields)
+    def make_setter(self, field: ParserField, post_setattr=None):
+        name = self.name
+        attname = field.attname
+        if self.options.immutable or field.immutable:
+            # immutability is fixed once the class is parsed
+            def setter(_obj_self: object, value):
+                raise exc.UpdateError(
+                    f"{name}: "
+                    f"Attempt to set immutable attribute: [{repr(attname)}]"
+                )
 
-            exclude_vars.update(parser.exclude_vars)
-            alias_map.update(parser.field_alias_map)
-            attr_alias_map.update(parser.attr_alias_map)
-            case_insensitive_names.update(parser.case_insensitive_names)
+            return setter
 
-        # cls_options = self.options  # add current cls options
-        # if cls_options:
-        #     option_list.append(cls_options)
-        #
-        # self.options = self.options_cls.generate_from(*option_list)
+        make_context = self.options.make_context
+        parse_value = field.parse_value
+        if not callable(post_setattr):
+            post_setattr = None
+            if field.passthrough:
+                # no type to parse and no hook to call, skip making the context
+                def setter(_obj_self: object, value):
+                    _obj_self.__dict__[attname] = value
 
-        self.fields = fields
-        self.exclude_vars = exclude_vars
-        self.field_alias_map = alias_map
-        self.attr_alias_map = attr_alias_map
-        self.case_insensitive_names = case_insensitive_names
+                return setter
 
-    def make_setter(self, field: ParserField, post_setattr=None):
         def setter(_obj_self: object, value):
-            if self.options.immutable or field.immutable:
-                raise exc.UpdateError(
-                    f"{self.name}: "
-                    f"Attempt to set immutable attribute: [{repr(field.attname)}]"
-                )
-
-            context = self.options.make_context(_obj_self.__class__, force_error=True)
-            value = field.parse_value(value, context=context)
-            _obj_self.__dict__[field.attname] = value
-            if callable(post_setattr):
+            context = make_context(_obj_self.__class__, force_error=True)
+            value = parse_value(value, context=context)
+            _obj_self.__dict__[attname] = value
+            if post_setattr:
                 post_setattr(_obj_self, field, value, context)
 
         return setter
 
     def make_deleter(self, field: ParserField, post_delattr=None):
-        def deleter(_obj_self: object):
-            if self.options.immutable or field.immutable:
+        name = self.name
+        attname = field.attname
+        if self.options.immutable or field.immutable:
+            def deleter(_obj_self: object):
                 raise exc.DeleteError(
-                    f"{self.name}: "
-                    f"Attempt to set immutable attribute: [{repr(field.attname)}]"
+                    f"{name}: "
+                    f"Attempt to set immutable attribute: [{repr(attname)}]"
                 )
 
-            context = self.options.make_context(_obj_self.__class__, force_error=True)
+            return deleter
+
+        make_context = self.options.make_context
+        if not callable(post_delattr):
+            post_delattr = None
+
+        def deleter(_obj_self: object):
+            context = make_context(_obj_self.__class__, force_error=True)
             if field.is_required(context.options):
                 raise exc.DeleteError(
-                    f"{self.name}: Attempt to delete required schema key: {repr(field.attname)}"
+                    f"{name}: Attempt to delete required schema key: {repr(attname)}"
                 )
 
-            if field.attname not in _obj_self.__dict__:
+            if attname not in _obj_self.__dict__:
                 raise exc.DeleteError(
-                    f"{self.name}: Attempt to delete nonexistent key: {repr(field.attname)}"
+                    f"{name}: Attempt to delete nonexistent key: {repr(attname)}"
                 )
 
-            _obj_self.__dict__.pop(field.attname)
+            _obj_self.__dict__.pop(attname)
 
-            if callable(post_delattr):
+            if post_delattr:
                 post_delattr(_obj_self, field, context)
 
         return deleter
 
     def make_getter(self, field: ParserField):
+        name = self.name
+        attname = field.attname
+
         def getter(_obj_self: object):
-            if field.attname not in _obj_self.__dict__:
+            try:
+                return _obj_self.__dict__[attname]
+            except KeyError:
                 raise AttributeError(
-                    f"{self.name}: {repr(field.attname)} not provided in schema"
-                )
-            return _obj_self.__dict__[field.attname]
+                    f"{name}: {repr(attname)} not provided in schema"
+                ) from None
 
         return getter
 
+    # bind the field to the custom accessors with closures
+    # partial(func, field=field) need to merge the keywords on every call
+    @classmethod
+    def bind_getter(cls, getter: Callable, field: ParserField):
+        def field_getter(_obj_self: object):
+            return getter(_obj_self, field=field)
+
+        return field_getter
+
+    @classmethod
+    def bind_setter(cls, setter: Callable, field: ParserField):
+        def field_setter(_obj_self: object, value):
+            return setter(_obj_self, value, field=field)
+
+        return field_setter
+
+    @classmethod
+    def bind_deleter(cls, deleter: Callable, field: ParserField):
+        def field_deleter(_obj_self: object):
+            return deleter(_obj_self, field=field)
+
+        return field_deleter
+
     def assign_properties(
         self,
         getter: Callable = None,
@@ -293,15 +373,15 @@ class ClassParser(BaseParser):
                 continue
 
             if getter:
-                field_getter = partial(getter, field=field)
+                field_getter = self.bind_getter(getter, field)
             else:
                 field_getter = self.make_getter(field)
             if setter:
-                field_setter = partial(setter, field=field)
+                field_setter = self.bind_setter(setter, field)
             else:
                 field_setter = self.make_setter(field, post_setattr=post_setattr)
             if deleter:
-                field_deleter = partial(deleter, field=field)
+                field_deleter = self.bind_deleter(deleter, field)
             else:
                 field_deleter = self.make_deleter(field, post_delattr=post_delattr)
 
@@ -313,9 +393,10 @@ class ClassParser(BaseParser):
             setattr(self.obj, field.attname, prop)
 
     def get_parser(self, obj_self: object):
-        if self.obj == obj_self.__class__:
+        cls = obj_self.__class__
+        if cls is self.obj:
             return self
-        return self.resolve_parser(obj_self.__class__)
+        return self.resolve_parser(cls)
 
     def _make_method(self, func: Callable, name: str = None):
         if name:
@@ -358,20 +439,29 @@ class ClassParser(BaseParser):
                 return False
             if _obj_self.__dict__ == other.__dict__:
                 return True
-            self_dict = dict(_obj_self.__dict__)
-            pop(self_dict, "__context__")
-            other_dict = dict(other.__dict__)
-            pop(other_dict, "__context__")
+            # only copy the dict that carries a __context__ to drop
+            self_dict = _obj_self.__dict__
+            if "__context__" in self_dict:
+                self_dict = dict(self_dict)
+                del self_dict["__context__"]
+            other_dict = other.__dict__
+            if "__context__" in other_dict:
+                other_dict = dict(other_dict)
+                del other_dict["__context__"]
             return self_dict == other_dict
 
         self._make_method(__eq__)
 
     def make_repr(self, ignore_str: bool = False):
+        # instance __dict__ is keyed by attname, resolve the fields of this class once
+        attname_fields = {field.attname: field for field in self.fields.values()}
+
         def __repr__(_obj_self):
             parser = self.get_parser(_obj_self)
+            fields = attname_fields if parser is self else {}
             items = []
             for key, val in _obj_self.__dict__.items():
-                field = parser.get_field(key)
+                field = fields.get(key) or parser.get_field(key)
                 if not field:
                     continue
                 items.append(f"{field.attname}={field.repr_value(val)}")
@@ -394,16 +484,19 @@ class ClassParser(BaseParser):
         options: Options,
     ):
 
-        for key, value in list(values.items()):
+        instance_dict = instance.__dict__
+        no_output_keys = []
+        for key, value in values.items():
             field = self.get_field(key)
             attname = key
             if field:
-                if field.is_no_output(values[key], options=options):
-                    values.pop(key)
+                if field.is_no_output(value, options=options):
+                    # pop after the iteration
+                    no_output_keys.append(key)
                 if field.property:
                     try:
                         field.property.fset(
-                            instance, values[key]
+                            instance, value
                         )  # call the original setter
                         # setattr(instance, field.attname, values[key])
                     except Exception as e:
@@ -418,9 +511,12 @@ class ClassParser(BaseParser):
 
             # TODO: it seems redundant for Schema, so we just use it as a fallback for now
             # and work on it later if something went wrong
-            instance.__dict__[attname] = value
+            instance_dict[attname] = value
             # set to __dict__ no matter field (maybe addition=True)
 
+        for key in no_output_keys:
+            values.pop(key)
+
     def make_context(self, context=None, force_error: bool = False):
         return self.options.make_context(self.obj, context=context, force_error=force_error)
 
@@ -445,7 +541,7 @@ class ClassParser(BaseParser):
             self.init_parser = init_parser
             return
 
-        if not inspect.isfunction(init_func) or self.function_parser_cls.function_pass(
+        if type(init_func) is not FunctionType or self.function_parser_cls.function_pass(
             init_func
         ):
             # if __init__ is declared but passed, we still make a new one
@@ -453,7 +549,9 @@ class ClassParser(BaseParser):
             def __init__(_obj_self, _d: dict = None, **kwargs):
                 parser = self.get_parser(_obj_self)
 
-                context = getattr(_obj_self, "__context__", None)
+                # read the instance dict directly, a plain instantiation has no
+                # __context__ and getattr would raise & swallow an AttributeError
+                context = _obj_self.__dict__.get("__context__")
                 if not isinstance(context, RuntimeContext):
                     context: RuntimeContext = parser.make_context()
 
@@ -523,8 +621,9 @@ def init_dataclass(
     transformer = new_context.transformer
 
     try:
-        if not isinstance(data, Mapping):
+        if type(data) is not dict and not isinstance(data, Mapping):
             # {} dict instance is an instance of Mapping too
+            # exact dict is checked first to skip the Mapping ABC check
             if transformer.no_explicit_cast:
                 raise TypeError(
                     f"invalid input type for {cls}, should be dict or Mapping"
@@ -4,20 +4,51 @@ from collections.abc import Mapping
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from ipaddress import IPv4Address, IPv6Address
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Union
 from uuid import UUID
 
 from ..utils import exceptions as exc
 from ..utils.compat import Literal, get_args, is_final, is_annotated
 from ..utils.datastructures import unprovided
 from ..utils.functional import copy_value, get_name, multi
-from .options import Options, RuntimeContext
+from .options import Options, RuntimeContext, intern_policy
 from .rule import ConstraintMode, Lax, LogicalType, Rule, resolve_forward_type
 
 represent = repr
+_EMPTY = inspect.Parameter.empty
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, Decimal, type(None))
+# defaults of these types can be returned directly without copy_value
 
 
 class Field:
+    __slots__ = (
+        "alias",
+        "alias_generator",
+        "alias_from",
+        "_alias_from",
+        "_alias_from_cache",
+        "case_insensitive",
+        "deprecated",
+        "deprecated_to",
+        "no_input",
+        "no_output",
+        "immutable",
+        "required",
+        "default",
+        "default_factory",
+        "defer_default",
+        "dependencies",
+        "discriminator",
+        "on_error",
+        "mode",
+        "title",
+        "description",
+        "example",
+        "repr",
+        "constraints",
+    )
+    # subclasses without __slots__ still get a __dict__ for their own attributes
+
     parser_field_cls = None
 
     def __init__(
@@ -91,23 +122,18 @@ class Field:
         min_contains: int = None,
         unique_items: Union[bool, ConstraintMode] = None,
     ):
-        if mode:
-            if readonly or writeonly:
+        if readonly or writeonly:
+            if mode:
                 raise exc.ConfigError(
                     f"Field: mode: ({represent(mode)}) cannot set with readonly or writeonly",
                     params={"mode": mode},
                 )
-
-        if readonly and writeonly:
-            raise exc.ConfigError(
-                f"Field: readonly and writeonly cannot be both specified",
-                params={"readonly": readonly, "writeonly": writeonly},
-            )
-
-        if readonly:
-            mode = "r"
-        if writeonly:
-            mode = "w"
+            if readonly and writeonly:
+                raise exc.ConfigError(
+                    f"Field: readonly and writeonly cannot be both specified",
+                    params={"readonly": readonly, "writeonly": writeonly},
+                )
+            mode = "r" if readonly else "w"
 
         if deprecated:
             required = False
@@ -178,7 +204,11 @@ class Field:
         self.alias = alias if isinstance(alias, str) else None
         self.alias_generator = alias if callable(alias) else None
         self.alias_from = alias_from
-        # self.alias_from =
+        # normalized alias_from, so get_alias_from does not need to query multi() again
+        self._alias_from = (
+            tuple(alias_from) if multi(alias_from) else (alias_from,)
+        ) if alias_from else ()
+        self._alias_from_cache = {}
         self.case_insensitive = case_insensitive
         self.deprecated = bool(deprecated)
         self.deprecated_to = deprecated if isinstance(deprecated, str) else None
@@ -217,7 +247,7 @@ class Field:
 
         self.dependencies = deps
         self.discriminator = discriminator
-        self.on_error = on_error
+        self.on_error = intern_policy(on_error)
         self.mode = mode
 
         self.title = title
@@ -240,57 +270,60 @@ class Field:
 
         constraints = {
             k: v
-            for k, v in dict(
-                enum=enum,
-                gt=gt,
-                ge=ge,
-                lt=lt,
-                le=le,
-                min_length=min_length,
-                max_length=max_length,
-                length=length,
-                regex=regex,
-                max_digits=max_digits,
-                decimal_places=decimal_places,
-                multiple_of=multiple_of,
-                contains=contains,
-                max_contains=max_contains,
-                min_contains=min_contains,
-                unique_items=unique_items,
-            ).items()
+            for k, v in (
+                ("enum", enum),
+                ("gt", gt),
+                ("ge", ge),
+                ("lt", lt),
+                ("le", le),
+                ("min_length", min_length),
+                ("max_length", max_length),
+                ("length", length),
+                ("regex", regex),
+                ("max_digits", max_digits),
+                ("decimal_places", decimal_places),
+                ("multiple_of", multiple_of),
+                ("contains", contains),
+                ("max_contains", max_contains),
+                ("min_contains", min_contains),
+                ("unique_items", unique_items),
+            )
             if v is not None
         }
         if not unprovided(const):
-            constraints.update(const=const)
+            constraints["const"] = const
 
         self.constraints = constraints
 
     def get_alias(self, attname: str, generator=None):
-        alias = attname
         if self.alias:
-            alias = self.alias
-        else:
-            generator = self.alias_generator or generator
-            if generator:
-                _alias = generator(attname)
-                if isinstance(_alias, str) and _alias:
-                    alias = _alias
-        return alias
-
-    def get_alias_from(self, attname: str, generator=None) -> Set[str]:
+            return self.alias
+        generator = self.alias_generator or generator
+        if not generator:
+            return attname
+        alias = generator(attname)
+        if isinstance(alias, str) and alias:
+            return alias
+        return attname
+
+    def get_alias_from(self, attname: str, generator=None) -> FrozenSet[str]:
+        if not self._alias_from and not generator:
+            return frozenset((attname,))
+
+        key = (attname, id(generator))
+        cached = self._alias_from_cache.get(key)
+        if cached:
+            # the generator is kept in the cache value, so its id cannot be reused
+            return cached[1]
+
         aliases = {attname}
-        alias_from = []
-        if self.alias_from:
-            if not multi(self.alias_from):
-                alias_from = [self.alias_from]
-            else:
-                alias_from = self.alias_from
+        if self._alias_from:
+            alias_from = self._alias_from
             # field alias_from will override generator
-        elif generator:
-            if multi(generator):
-                alias_from.extend(generator)
-            else:
-                alias_from.append(generator)
+        elif multi(generator):
+            alias_from = generator
+        else:
+            alias_from = (generator,)
 
         for alias in alias_from:
             if callable(alias):
@@ -300,6 +333,8 @@ class Field:
             elif isinstance(alias, str) and alias:
                 aliases.add(alias)
 
+        aliases = frozenset(aliases)
+        self._alias_from_cache[key] = (generator, aliases)
         return aliases
 
     # def to_spec(self):
@@ -359,43 +394,96 @@ class Param(Field):
         super().__init__(**kwargs)
 
 
+TYPE_PRIMITIVE = {
+    str: "string",
+    int: "number",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    frozenset: "array",
+    dict: "object",
+    bytes: "string",
+    Decimal: "number",
+    date: "string",
+    time: "string",
+    datetime: "string",
+    UUID: "string",
+    Mapping: "object",
+}
+
+TYPE_FORMAT = {
+    int: "integer",
+    float: "float",
+    tuple: "tuple",
+    set: "set",
+    frozenset: "set",
+    bytes: "binary",
+    Decimal: "decimal",
+    date: "date",
+    time: "time",
+    datetime: "date-time",
+    UUID: "uuid",
+    timedelta: "duration",
+    timezone: "timezone",
+    IPv4Address: "ipv4",
+    IPv6Address: "ipv6",
+}
+
+
 class ParserField:
-    TYPE_PRIMITIVE = {
-        str: "string",
-        int: "number",
-        float: "number",
-        bool: "boolean",
-        list: "array",
-        tuple: "array",
-        set: "array",
-        frozenset: "array",
-        dict: "object",
-        bytes: "string",
-        Decimal: "number",
-        date: "string",
-        time: "string",
-        datetime: "string",
-        UUID: "string",
-        Mapping: "object",
-    }
-
-    TYPE_FORMAT = {
-        int: "integer",
-        float: "float",
-        tuple: "tuple",
-        set: "set",
-        frozenset: "set",
-        bytes: "binary",
-        Decimal: "decimal",
-        date: "date",
-        time: "time",
-        datetime: "date-time",
-        UUID: "uuid",
-        timedelta: "duration",
-        timezone: "timezone",
-        IPv4Address: "ipv4",
-        IPv6Address: "ipv6",
-    }
+    __slots__ = (
+        "_kwargs",
+        "attname",
+        "type",
+        "output_type",
+        "field",
+        "output_field",
+        "property",
+        "final",
+        "name",
+        "aliases",
+        "all_aliases",
+        "dependencies",
+        "attr_dependencies",
+        "dependants",
+        "input_transformer",
+        "output_transformer",
+        "const",
+        "discriminator_map",
+        "positional_only",
+        "deprecated_to",
+        "repr_func",
+        "mode",
+        "no_input",
+        "no_output",
+        "default_factory",
+        "default",
+        "required",
+        "defer_default",
+        "on_error",
+        "case_insensitive",
+        # resolved in setup()
+        "_no_input_fixed",
+        "_no_input_func",
+        "_no_input_flag",
+        "_always_no_input",
+        "_no_output_func",
+        "_no_output_flag",
+        "_required_flag",
+        "_modes",
+        "_no_input_modes",
+        "_no_output_modes",
+        "_required_modes",
+        "_immutable_default",
+        "_deprecated_warning",
+        "_case_insensitive",
+    )
+
+    # module-level mappings, kept here for backward compatibility
+    TYPE_PRIMITIVE = TYPE_PRIMITIVE
+    TYPE_FORMAT = TYPE_FORMAT
 
     SECRET_EXEMPT_TYPES = (bool,)
     SECRET_REPR = "*" * 6
@@ -434,8 +522,12 @@ class ParserField:
         self.property = field_property
         self.final = final
         self.name = name
-        self.aliases = set(aliases or []).difference({self.name})
-        self.all_aliases = self.aliases.union({self.name})
+        # aliases are read-only after setup, build them once and freeze
+        aliases = set(aliases or ())
+        aliases.discard(name)
+        self.aliases = frozenset(aliases)
+        aliases.add(name)
+        self.all_aliases = frozenset(aliases)
 
         # self.input_transformer = self.transformer_cls.resolver_transformer(input_type)
         self.dependencies = dependencies
@@ -510,11 +602,38 @@ class ParserField:
         return represent(value)
 
     def setup(self, options: Options):
+        # resolve the constant part of no_input / no_output / required here
+        # so that the per-value checks only branch on a few precomputed flags
+        self._no_input_fixed = bool(self.final and not self.no_default)
+        self._no_input_func = self.no_input if callable(self.no_input) else None
+        self._no_input_flag = self._no_input_fixed or (
+            self.no_input if isinstance(self.no_input, bool) else False
+        )
+        self._always_no_input = self._no_input_fixed or self.no_input is True
+        self._no_output_func = self.no_output if callable(self.no_output) else None
+        self._no_output_flag = (
+            self.no_output if isinstance(self.no_output, bool) else False
+        )
+        self._required_flag = self.required is True
+        # resolve the mode containers once, so the per-value checks skip the type tests
+        self._modes = self.get_modes(self.mode) if self.mode else None
+        self._no_input_modes = self.get_modes(self.no_input)
+        self._no_output_modes = self.get_modes(self.no_output)
+        self._required_modes = self.get_modes(self.required)
+        self._immutable_default = isinstance(self.default, IMMUTABLE_TYPES)
+        self._deprecated_warning = (
+            f"{repr(self.name)} is deprecated" if self.field.deprecated else None
+        )
+        # None means follow the options
+        self._case_insensitive = (
+            None if self.case_insensitive is None else bool(self.case_insensitive)
+        )
+
         if self.is_case_insensitive(options):
             # do not lower name
             # self.name = self.name.lower()
-            self.aliases = {a.lower() for a in self.aliases}
-            self.all_aliases = {a.lower() for a in self.all_aliases}
+            self.aliases = frozenset(a.lower() for a in self.aliases)
+            self.all_aliases = frozenset(a.lower() for a in self.all_aliases)
 
         if self.repr_func is None:
             if options.secret_names:
@@ -563,6 +682,7 @@ class ParserField:
                     self.output_transformer = trans
 
         if self.discriminator:
+            discriminator = self.discriminator
             discriminator_map = {}
             comb = None
             if isinstance(self.type, LogicalType):
@@ -571,7 +691,7 @@ class ParserField:
             if not comb:
                 raise TypeError(
                     f"Field: {repr(self.attname)} specify a discriminator: "
-                    f"{repr(self.discriminator)}, but got a common type: {self.type} "
+                    f"{repr(discriminator)}, but got a common type: {self.type} "
                     f"which does not support discriminator"
                 )
 
@@ -587,19 +707,19 @@ class ParserField:
                     if not cls_parser:
                         raise exc.ConfigError(
                             f"Field: {repr(self.attname)} specify a discriminator: "
-                            f"{repr(self.discriminator)}, but got a type: {arg} "
+                            f"{repr(discriminator)}, but got a type: {arg} "
                             f"that not support, must be a data class "
                             f"(like subclass of DataClass / Schema or "
                             f"use @dataclass to decorate a class)",
                             field=self.name,
                         )
 
-                    field = cls_parser.get_field(self.discriminator)
+                    field = cls_parser.get_field(discriminator)
                     if not isinstance(field, ParserField):
                         raise exc.ConfigError(
                             f"Field: {repr(self.attname)} specify a discriminator: "
-                            f"{repr(self.discriminator)}, but is was not find in type: "
-                            f"{arg}, you should define {self.discriminator}: "
+                            f"{repr(discriminator)}, but is was not find in type: "
+                            f"{arg}, you should define {discriminator}: "
                             f'Literal["some-value"] in that schema',
                             field=self.name,
                         )
@@ -608,9 +728,9 @@ class ParserField:
                     if not isinstance(const, (int, str, bool)):
                         raise exc.ConfigError(
                             f"Field: {repr(self.attname)} specify a discriminator: "
-                            f"{repr(self.discriminator)}, but in type {arg}, there is no"
+                            f"{repr(discriminator)}, but in type {arg}, there is no"
                             f" common type const ({repr(const)}) set for this field, you should "
-                            f"define {self.discriminator}: "
+                            f"define {discriminator}: "
                             f'Literal["some-value"] in that schema',
                             field=self.name,
                         )
@@ -618,7 +738,7 @@ class ParserField:
                     if const in discriminator_map:
                         raise exc.ConfigError(
                             f"Field: {repr(self.attname)} with discriminator: "
-                            f"{repr(self.discriminator)}, got a duplicate value:"
+                            f"{repr(discriminator)}, got a duplicate value:"
                             f" {repr(const)} for {arg} and {discriminator_map[const]}",
                             field=self.name,
                         )
@@ -628,7 +748,7 @@ class ParserField:
             else:
                 raise TypeError(
                     f"Field: {repr(self.attname)} specify a discriminator: "
-                    f"{repr(self.discriminator)}, but got a logical type: {self.type} "
+                    f"{repr(discriminator)}, but got a logical type: {self.type} "
                     f"with combinator: {repr(comb.combinator)} which does not support discriminator, "
                     f'only "^"(OneOf) or "|"(AnyOf) support'
                 )
@@ -692,6 +812,9 @@ class ParserField:
                     f" but prefer field : {repr(to)} not exists"
                 )
             self.deprecated_to = to
+            self._deprecated_warning = (
+                f"{repr(self.name)} is deprecated, use {repr(to)} instead"
+            )
 
     def resolve_forward_refs(self):
         if self.type:
@@ -699,15 +822,21 @@ class ParserField:
         if self.output_type:
             self.output_type, r = resolve_forward_type(self.output_type)
 
+    @property
+    def passthrough(self) -> bool:
+        # parse_value returns the value as it is, without using the context
+        return not self.type and not self._deprecated_warning
+
     @property
     def always_provided(self):
         # required is mode str or callable does not means
         return self.required is True or not self.no_default
 
     def is_case_insensitive(self, options: Options) -> bool:
-        if self.case_insensitive is not None:
-            return bool(self.case_insensitive)
-        return bool(options.case_insensitive)
+        case_insensitive = self._case_insensitive
+        if case_insensitive is None:
+            return bool(options.case_insensitive)
+        return case_insensitive
 
     # def get_unprovided(self, options: Options):
     #     # options = options or self.options
@@ -736,6 +865,8 @@ class ParserField:
         if not unprovided(options.force_default):
             default = options.force_default
         elif not unprovided(self.default):
+            if self._immutable_default:
+                return self.default
             default = self.default
         elif self.default_factory:
             try:
@@ -759,58 +890,72 @@ class ParserField:
         if not unprovided(self.field.example):
             return self.field.example
 
+    @classmethod
+    def get_modes(cls, modes):
+        # mode strings are kept as-is: options.mode like "wa" is a substring test
+        # empty str / containers are kept too (nothing is in them), None means not a mode container
+        if isinstance(modes, str):
+            return modes
+        if isinstance(modes, (list, set, tuple, frozenset)):
+            return frozenset(modes)
+        return None
+
     def is_required(self, options: Options):
         if options.ignore_required or not self.required:
             return False
-        if self.always_no_input(options):
+        if self._always_no_input:
             return False
-        if self.required is True:
-            return True
         if not options.mode:
+            return self._required_flag
+        if self.always_no_input(options):
             return False
-        return options.mode in self.required
+        if self._required_flag:
+            return True
+        if self._required_modes is None:
+            return bool(self.required)
+        return options.mode in self._required_modes
+
+    def _is_mode_excluded(self, flag, mode: str, modes=None) -> bool:
+        if modes is not None:
+            return mode in modes
+        if isinstance(flag, (str, list, set, tuple)):
+            return mode in flag
+        if flag is True:
+            return True
+        if self._modes is not None:
+            return mode not in self._modes
+        return bool(flag)
 
     def is_no_input(self, value, options: Options):
-        if self.final:
-            if not self.no_default:
-                return True
-
-        no_input = (
-            self.no_input(value)
-            if callable(self.no_input)
-            else self.no_input
-        )
+        if self._no_input_fixed:
+            return True
+        func = self._no_input_func
+        if func is None:
+            if not options.mode:
+                # no mode
+                return self._no_input_flag
+            return self._is_mode_excluded(
+                self.no_input, options.mode, self._no_input_modes
+            )
 
+        no_input = func(value)
         if not options.mode:
             # no mode
             return no_input if isinstance(no_input, bool) else False
-
-        if isinstance(no_input, (str, list, set, tuple)):
-            return options.mode in no_input
-
-        if no_input is True:
-            return True
-
-        if self.mode:
-            return options.mode not in self.mode
-
-        return bool(no_input)
+        return self._is_mode_excluded(no_input, options.mode)
 
     def always_no_input(self, options: Options):
         # calculate before get the value
-        if self.final:
-            if not self.no_default:
-                return True
-        if self.no_input is True:
+        if self._always_no_input:
             return True
         if not options.mode:
             return False
-        if callable(self.no_input):
+        if self._no_input_func is not None:
             return False
-        if isinstance(self.no_input, (str, list, set, tuple)):
-            return options.mode in self.no_input
-        if self.mode:
-            return options.mode not in self.mode
+        if self._no_input_modes is not None:
+            return options.mode in self._no_input_modes
+        if self._modes is not None:
+            return options.mode not in self._modes
         return False
 
     def always_no_output(self, options: Options):
@@ -819,39 +964,35 @@ class ParserField:
             return True
         if not options.mode:
             return False
-        if callable(self.no_output):
+        if self._no_output_func is not None:
             return False
-        if isinstance(self.no_output, (str, list, set, tuple)):
-            return options.mode in self.no_output
-        if self.mode:
-            return options.mode not in self.mode
+        if self._no_output_modes is not None:
+            return options.mode in self._no_output_modes
+        if self._modes is not None:
+            return options.mode not in self._modes
         return False
 
     def is_no_output(self, value, options: Options):
         # field = self.output_field or self.field
         # prefer the config in output field rather than input field
-        no_output = (
-            self.no_output(value)
-            if callable(self.no_output)
-            else self.no_output
-        )
+        func = self._no_output_func
+        if func is None:
+            if not options.mode:
+                # no mode
+                return self._no_output_flag
+            return self._is_mode_excluded(
+                self.no_output, options.mode, self._no_output_modes
+            )
 
+        no_output = func(value)
         if not options.mode:
             # no mode
             return no_output if isinstance(no_output, bool) else False
+        return self._is_mode_excluded(no_output, options.mode)
 
-        if isinstance(no_output, (str, list, set, tuple)):
-            return options.mode in no_output
-
-        if no_output is True:
-            return True
-
-        if self.mode:
-            return options.mode not in self.mode
-
-        return bool(no_output)
-
-    def check_function(self, func):
+    def check_function(self, func, warns: List[str] = None):
+        # pass a warns list to collect the messages and emit them after all the params are checked
+        messages = [] if warns is None else warns
         if not self.always_provided:
             raise exc.ConfigError(
                 f"{func}: Field(name={repr(self.name)}) in function with required=False "
@@ -895,42 +1036,46 @@ class ParserField:
 
         if self.positional_only:
             if self.field.alias:
-                warnings.warn(
+                messages.append(
                     f"{func}: Field(name={repr(self.name)}).alias ({repr(self.field.alias)}) "
                     f"has no meanings in positional only params,"
                     f" please consider move it"
                 )
             if self.field.alias_from:
-                warnings.warn(
+                messages.append(
                     f"{func}: Field(name={repr(self.name)}).alias_from ({repr(self.field.alias_from)}) "
                     f"has no meanings in positional only params,"
                     f" please consider move it"
                 )
             if self.case_insensitive:
-                warnings.warn(
+                messages.append(
                     f"{func}: Field(name={repr(self.name)}).case_insensitive "
                     f"has no meanings in positional only params,"
                     f" please consider move it"
                 )
 
         if self.no_output:
-            warnings.warn(
+            messages.append(
                 f"{func}: Field(name={repr(self.name)}).no_output has no meanings in function params,"
                 f" please consider move it"
             )
 
         if self.immutable:
-            warnings.warn(
+            messages.append(
                 f"{func}: Field(name={repr(self.name)}).immutable has no meanings in function params, "
                 f"please consider move it"
             )
 
         if self.field.repr:
-            warnings.warn(
+            messages.append(
                 f"{func}: Field(name={repr(self.name)}).repr has no meanings in function params,"
                 f" please consider move it"
             )
 
+        if warns is None:
+            for msg in messages:
+                warnings.warn(msg)
+
     # 1. deal with parse: use context
     def parse_output_value(self, value, context: RuntimeContext):
         type = self.output_type
@@ -961,20 +1106,22 @@ class ParserField:
             return unprovided
 
     def parse_value(self, value, context: RuntimeContext):
-        if self.field.deprecated:
-            to = (
-                f", use {repr(self.deprecated_to)} instead"
-                if self.deprecated_to
-                else ""
-            )
+        if self._deprecated_warning:
             context.collect_waring(
-                f"{repr(self.name)} is deprecated{to}", category=DeprecationWarning
+                self._deprecated_warning, category=DeprecationWarning
             )
-
-        type = self.type
-        # trans = context.transformer
-
         if self.discriminator_map and value is not None:
+            return self._parse_discriminated(value, context=context)
+        return self._parse_typed(value, self.type, context=context)
+
+    def _parse_discriminated(self, value, context: RuntimeContext):
+        if type(value) is dict:
+            # look up the key directly, plain dict inputs are the common case
+            try:
+                discriminator = value[self.discriminator]
+            except KeyError:
+                discriminator = None
+        else:
             if not isinstance(value, Mapping):
                 try:
                     value = context.transformer.to_dict(value)
@@ -989,24 +1136,30 @@ class ParserField:
                         )
                     )
                     return unprovided
-
+            # .get() will not trigger __missing__ of mappings like defaultdict
             discriminator = value.get(self.discriminator)
-            if discriminator in self.discriminator_map:
-                type = self.discriminator_map[discriminator]
-                # directly assign type instead parse it in a Logical context
-            else:
-                context.handle_error(
-                    exc.DiscriminatorMismatchError(
-                        discriminator=self.discriminator,
-                        discriminator_value=discriminator,
-                        field=self,
-                        value=value,
-                        item=self.name,
-                        type=self.type,
-                    )
+
+        try:
+            discriminated_type = self.discriminator_map.get(discriminator)
+        except TypeError:
+            # unhashable discriminator value
+            discriminated_type = None
+        if discriminated_type is None:
+            context.handle_error(
+                exc.DiscriminatorMismatchError(
+                    discriminator=self.discriminator,
+                    discriminator_value=discriminator,
+                    field=self,
+                    value=value,
+                    item=self.name,
+                    type=self.type,
                 )
-                return unprovided
+            )
+            return unprovided
+        # directly assign type instead parse it in a Logical context
+        return self._parse_typed(value, discriminated_type, context=context)
 
+    def _parse_typed(self, value, type, context: RuntimeContext):
         if not type:
             # type is None, not type(None), means the exact same as Any / Rule
             return value
@@ -1058,6 +1211,32 @@ class ParserField:
         else:
             return default
 
+    @classmethod
+    def get_setter_param(cls, fset):
+        """
+        get the (annotation, default) of the value param in a property setter
+        like def prop(self, value: str = Field(...))
+        """
+        code = getattr(fset, "__code__", None)
+        if (
+            code is not None
+            and code.co_argcount == 2
+            and not code.co_kwonlyargcount
+            and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+            and not hasattr(fset, "__wrapped__")
+        ):
+            # the plain (self, value) shape, read the function attributes directly
+            # instead of building the whole inspect.signature
+            defaults = getattr(fset, "__defaults__", None)
+            annotations = getattr(fset, "__annotations__", None) or {}
+            return (
+                annotations.get(code.co_varnames[1], _EMPTY),
+                defaults[-1] if defaults else _EMPTY,
+            )
+        _, (k, param) = inspect.signature(fset).parameters.items()
+        param: inspect.Parameter
+        return param.annotation, param.default
+
     @classmethod
     def generate(
         cls,
@@ -1084,14 +1263,13 @@ class ParserField:
             prop = default
             default = unprovided
             if prop.fset:
-                _, (k, param) = inspect.signature(prop.fset).parameters.items()
-                param: inspect.Parameter
-                if param.annotation != param.empty:
-                    annotation = param.annotation
+                param_annotation, param_default = cls.get_setter_param(prop.fset)
+                if param_annotation is not _EMPTY:
+                    annotation = param_annotation
 
                 field = getattr(prop.fset, "__field__", None)
 
-                if param.default != param.empty:
+                if param_default is not _EMPTY:
                     # @property
                     # @Field(...)
                     # def prop(self):
@@ -1101,9 +1279,9 @@ class ParserField:
                     # def prop(self, value: str = Field(...)):
                     #     pass
 
-                    # default = param.default
-                    if isinstance(param.default, Field):
-                        field = param.default
+                    # default = param_default
+                    if isinstance(param_default, Field):
+                        field = param_default
 
                         # some invalid configures
                         if field.alias:
@@ -1121,7 +1299,7 @@ class ParserField:
                             )
 
                     else:
-                        default = param.default
+                        default = param_default
                         # raise ValueError(
                         #     f"property: {repr(attname)} defines Field i"
                         #     f"n setter param default value, which is not appropriate, "
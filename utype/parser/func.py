@@ -3,12 +3,13 @@ import warnings
 from collections.abc import (AsyncGenerator, AsyncIterable, AsyncIterator,
                              Callable, Generator, Iterable, Iterator, Mapping)
 from functools import wraps
+from types import AsyncGeneratorType, FunctionType, GeneratorType, MethodType
 from typing import List, Tuple, Optional
+from weakref import WeakKeyDictionary
 
 from ..utils import exceptions as exc
 from ..utils.compat import is_classvar, is_final
 from ..utils.datastructures import cached_property, unprovided
-from ..utils.functional import pop
 from .base import BaseParser
 from .field import ParserField
 from .options import Options, RuntimeContext
@@ -16,6 +17,15 @@ from .rule import Rule, resolve_forward_type
 
 LAMBDA_NAME = (lambda: None).__name__
 LOCALS_NAME = "<locals>"
+INVALID_PRESERVE = Options.PRESERVE
+INVALID_EXCLUDE = Options.EXCLUDE
+
+_EMPTY = inspect.Parameter.empty
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
 
 
 def _f_pass_doc():
@@ -26,25 +36,76 @@ def _f_pass():
     pass
 
 
-PASSED_CODES = (
-    _f_pass.__code__.co_code,
-    _f_pass_doc.__code__.co_code,
+PASSED_CODES = frozenset(
+    (
+        _f_pass.__code__.co_code,
+        _f_pass_doc.__code__.co_code,
+    )
 )
+_MAX_PASSED_CODE_LEN = max(len(code) for code in PASSED_CODES)
+
+# function -> parameter items of its signature
+_signature_parameters = WeakKeyDictionary()
 
 
 class FunctionParser(BaseParser):
+    # the per-call attributes get slot access, BaseParser attributes
+    # and the cached properties still live in __dict__
+    __slots__ = (
+        "from_class",
+        "instancemethod",
+        "classmethod",
+        "staticmethod",
+        "first_reserve",
+        "is_method",
+        "is_lambda",
+        "is_coroutine",
+        "is_generator",
+        "is_async_generator",
+        "is_asynchronous",
+        "is_passed",
+        "reserve_name",
+        "exclude_indexes",
+        "parameters",
+        "kw_var",
+        "pos_var_index",
+        "pos_var",
+        "pos_key_map",
+        "arg_index",
+        "max_args",
+        "min_args",
+        "pos_annotation",
+        "kw_annotation",
+        "return_annotation",
+        "arg_names",
+        "kw_names",
+        "pos_only_keys",
+        "common_arg_names",
+        "position_type",
+        "return_type",
+        "generator_send_type",
+        "generator_yield_type",
+        "generator_return_type",
+        "do_parse_generator",
+    )
+
     @classmethod
     def function_pass(cls, f):
-        if not inspect.isfunction(f):
+        if type(f) is not FunctionType:
             return False
-        return getattr(f, "__code__").co_code in PASSED_CODES
+        code = f.__code__.co_code
+        # any function body longer than a bare pass cannot match, skip the hashing
+        return len(code) <= _MAX_PASSED_CODE_LEN and code in PASSED_CODES
 
     @classmethod
     def validate_function(cls, f):
+        # FunctionType and MethodType cannot be subclassed, so exact type checks
+        # match inspect.isfunction / inspect.ismethod without the extra calls
+        ft = type(f)
         return (
-            isinstance(f, (staticmethod, classmethod))
-            or inspect.ismethod(f)
-            or inspect.isfunction(f)
+            ft is FunctionType
+            or ft is MethodType
+            or isinstance(f, (staticmethod, classmethod))
         )
 
     @classmethod
@@ -88,9 +149,9 @@ class FunctionParser(BaseParser):
         elif isinstance(f, staticmethod):
             first_reserve = False
             f = f.__func__
-        elif inspect.ismethod(f):
+        elif type(f) is MethodType:
             first_reserve = False
-        elif not inspect.isfunction(f):
+        elif type(f) is not FunctionType:
             raise TypeError(f"Invalid function: {f}")
         return f, first_reserve
 
@@ -102,6 +163,32 @@ class FunctionParser(BaseParser):
             return None
         return getattr(f, "__annotations__", {}).get("return")
 
+    @classmethod
+    def apply_for(cls, obj, no_cache: bool = False, options=None, **kwargs) -> "FunctionParser":
+        if no_cache:
+            # signature / annotations may have changed, do not use the cached parameters
+            try:
+                _signature_parameters.pop(obj, None)
+            except TypeError:
+                pass
+        return super().apply_for(obj, no_cache=no_cache, options=options, **kwargs)
+
+    @classmethod
+    def get_parameters(cls, func) -> Tuple[Tuple[str, inspect.Parameter], ...]:
+        # inspect.signature is expensive, the same function may be parsed again
+        # like in decorator stacking (apply_for with no_cache will drop the cached one)
+        try:
+            return _signature_parameters[func]
+        except (KeyError, TypeError):
+            pass
+        parameters = tuple(inspect.signature(func).parameters.items())
+        try:
+            _signature_parameters[func] = parameters
+        except TypeError:
+            # not support weakref
+            pass
+        return parameters
+
     @classmethod
     def infer_instancemethod(cls, func):
         return (
@@ -123,15 +210,15 @@ class FunctionParser(BaseParser):
 
         func, self.first_reserve = self.analyze_func(func)
 
-        self.is_method = inspect.ismethod(func)
-        self.is_lambda = inspect.isfunction(func) and func.__name__ == LAMBDA_NAME
+        self.is_method = type(func) is MethodType
+        self.is_lambda = type(func) is FunctionType and func.__name__ == LAMBDA_NAME
         self.is_coroutine = inspect.iscoroutinefunction(func)
         self.is_generator = inspect.isgeneratorfunction(func)
         self.is_async_generator = inspect.isasyncgenfunction(func)
         self.is_asynchronous = self.is_coroutine or self.is_async_generator
         self.is_passed = self.function_pass(func)
 
-        parameters = inspect.signature(func).parameters.items()
+        parameters = self.get_parameters(func)
 
         if self.from_class:
             # within a class context, the instance method is easy to detect
@@ -157,11 +244,11 @@ class FunctionParser(BaseParser):
                     if (
                         first_param.kind
                         in (
-                            first_param.POSITIONAL_ONLY,
-                            first_param.POSITIONAL_OR_KEYWORD,
+                            _POSITIONAL_ONLY,
+                            _POSITIONAL_OR_KEYWORD,
                         )
-                        and first_param.default is first_param.empty
-                        and first_param.annotation is first_param.empty
+                        and first_param.default is _EMPTY
+                        and first_param.annotation is _EMPTY
                     ):
 
                         if self.infer_instancemethod(func):
@@ -177,7 +264,7 @@ class FunctionParser(BaseParser):
         # defaults = {k: v.default for k, v in self.parameters if v.default is not v.empty}
         # if a param is not defaulted or annotated, it rule is Rule(require=True)
 
-        self.exclude_indexes = set()
+        self.exclude_indexes = frozenset()
         self.parameters: Iterable[Tuple[str, inspect.Parameter]] = parameters
         self.kw_var = None  # only for function, **kwargs
         self.pos_var_index = None
@@ -198,34 +285,36 @@ class FunctionParser(BaseParser):
         for i, (k, v) in enumerate(self.parameters):
             v: inspect.Parameter
             arg_names.append(k)
-            if v.kind == v.VAR_POSITIONAL:
+            kind = v.kind
+            if kind == _VAR_POSITIONAL:
                 self.pos_var_index = i
                 self.pos_var = k
-                if v.annotation != v.empty:
+                if v.annotation is not _EMPTY:
                     self.pos_annotation = v.annotation
                 continue
-            elif v.kind == v.VAR_KEYWORD:
+            elif kind == _VAR_KEYWORD:
                 self.kw_var = k
-                if v.annotation != v.empty:
+                if v.annotation is not _EMPTY:
                     self.kw_annotation = v.annotation
                 continue
             else:
                 common_arg_names.append(k)
-                if v.kind == v.POSITIONAL_ONLY:
+                if kind == _POSITIONAL_ONLY:
                     pos_only_keys.append(k)
                     self.min_args += 1
                 else:
                     kw_names.append(k)
 
-                if v.kind != v.KEYWORD_ONLY:
+                if kind != _KEYWORD_ONLY:
                     self.max_args += 1
                     self.pos_key_map[i] = k
                     self.arg_index[k] = i
 
-        self.arg_names = arg_names
-        self.kw_names = kw_names
-        self.pos_only_keys = pos_only_keys
-        self.common_arg_names = common_arg_names
+        # read-only after init
+        self.arg_names = tuple(arg_names)
+        self.kw_names = tuple(kw_names)
+        self.pos_only_keys = tuple(pos_only_keys)
+        self.common_arg_names = tuple(common_arg_names)
 
         if self.kw_var:
             opt_list = [options]
@@ -283,14 +372,15 @@ class FunctionParser(BaseParser):
             self.position_type = self.parse_annotation(annotation=self.pos_annotation)
 
         self.generate_return_types()
-
-    # @property
-    # def do_parse_generator(self):
-    #     return (self.is_generator or self.is_async_generator) and (
-    #         self.generator_send_type
-    #         or self.generator_yield_type
-    #         or self.generator_return_type
-    #     )
+        # the generator types are settled after generate_return_types
+        self.do_parse_generator = bool(
+            (self.is_generator or self.is_async_generator)
+            and (
+                self.generator_send_type
+                or self.generator_yield_type
+                or self.generator_return_type
+            )
+        )
 
     def generate_return_types(self):
         # see if the return type match the function
@@ -342,6 +432,23 @@ class FunctionParser(BaseParser):
             fields[index] = field
         return fields
 
+    @cached_property
+    def positional_field_list(self) -> List[Optional[ParserField]]:
+        # dense version of positional_fields, indexed by the arg index
+        fields = [None] * self.max_args
+        for index, field in self.positional_fields.items():
+            fields[index] = field
+        return fields
+
+    @cached_property
+    def positional_handlers(self) -> List[Optional[Tuple[Callable, Callable, Callable, str]]]:
+        # pre-bound field methods for each arg index, to save the lookups per call
+        return [
+            (field.is_no_input, field.get_default, field.parse_value, field.attname)
+            if field else None
+            for field in self.positional_field_list
+        ]
+
     @cached_property
     def positional_only_fields(self) -> List[Tuple[int, ParserField]]:
         fields = []
@@ -371,16 +478,17 @@ class FunctionParser(BaseParser):
         fields = []
 
         for i, (name, param) in enumerate(self.parameters):
+            kind = param.kind
             if not self.validate_field_name(name):
                 exclude_vars.add(name)
-                if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                if kind in (_POSITIONAL_ONLY, _POSITIONAL_OR_KEYWORD):
                     exclude_indexes.add(i)
                 continue
-            if param.kind in (param.VAR_KEYWORD, param.VAR_POSITIONAL):
+            if kind in (_VAR_KEYWORD, _VAR_POSITIONAL):
                 continue
 
             annotation = None
-            if param.annotation is not param.empty:
+            if param.annotation is not _EMPTY:
                 if param.annotation is None:
                     annotation = type(None)
                     # annotation = None means no annotation (param.empty)
@@ -400,17 +508,18 @@ class FunctionParser(BaseParser):
                     attname=name,
                     annotation=annotation,
                     default=param.default
-                    if param.default is not param.empty
+                    if param.default is not _EMPTY
                     else unprovided,
                     global_vars=global_vars,
                     forward_refs=self.forward_refs,
                     options=self.options,
-                    positional_only=param.kind == param.POSITIONAL_ONLY,
+                    positional_only=kind == _POSITIONAL_ONLY,
                     **self.kwargs
                 )
             )
 
         field_map = {}
+        warns = []
         for field in fields:
             name = field.name
 
@@ -426,12 +535,16 @@ class FunctionParser(BaseParser):
                 )
             if not self.is_passed:
                 # is function is :pass, we do not check for now
-                field.check_function(self.obj)  # check for function
+                field.check_function(self.obj, warns=warns)  # check for function
             field_map[name] = field
 
+        for msg in warns:
+            # one warning per message, so message filters still match
+            warnings.warn(msg)
+
         self.fields.update(field_map)
-        self.exclude_vars = exclude_vars
-        self.exclude_indexes = exclude_indexes
+        self.exclude_vars = frozenset(exclude_vars)
+        self.exclude_indexes = frozenset(exclude_indexes)
 
     def validate_fields(self):
         """
@@ -446,12 +559,8 @@ class FunctionParser(BaseParser):
         optional_name = None
         for i, (k, v) in enumerate(self.parameters):
             v: inspect.Parameter
-            if v.kind == v.VAR_POSITIONAL:
-                continue
-            elif v.kind == v.VAR_KEYWORD:
-                continue
-
-            if v.kind == v.KEYWORD_ONLY:
+            kind = v.kind
+            if kind in (_VAR_POSITIONAL, _VAR_KEYWORD, _KEYWORD_ONLY):
                 # keyword args does not need to check for default order
                 continue
 
@@ -459,7 +568,7 @@ class FunctionParser(BaseParser):
             if field:
                 required = field.no_default
             else:
-                required = v.default != v.empty
+                required = v.default is not _EMPTY
 
             if required:
                 if optional_name:
@@ -467,7 +576,7 @@ class FunctionParser(BaseParser):
                         f"{self.obj}: non-default argument: {repr(k)} "
                         f"follows default argument: {repr(optional_name)}"
                     )
-                    if v.kind == v.POSITIONAL_ONLY:
+                    if kind == _POSITIONAL_ONLY:
                         raise SyntaxError(msg)
                     else:
                         warnings.warn(msg)
@@ -522,14 +631,22 @@ class FunctionParser(BaseParser):
             # if eager_parse:
             #     warnings.warn(f'{self.obj} is a sync function')
 
+            # resolve the wrap-time constants once instead of per call
+            make_context = (options or self.options).make_context
+            sync_call = self.sync_call
+            if first_reserve is None:
+                first_reserve = self.first_reserve
+            if not self.return_type:
+                # forward refs resolving will not clear the return type, safe to decide here
+                parse_result = False
+
             @wraps(self.obj)
             def f(*args, **kwargs):  # noqa
                 # MAKE CONTEXT AT RUNTIME !
-                context = options.make_context() if options else self.make_context()
-                return self.sync_call(
+                return sync_call(
                     args,
                     kwargs,
-                    context=context,
+                    context=make_context(),
                     first_reserve=first_reserve,
                     parse_params=parse_params,
                     parse_result=parse_result,
@@ -558,9 +675,11 @@ class FunctionParser(BaseParser):
                 error = exc.ParseError(
                     item=new_context.route, value=value, type=pos_type, origin_exc=e
                 )
-                if options.invalid_items == options.PRESERVE:
+                # policies are interned by Options, so these compare by identity first
+                invalid_items = options.invalid_items
+                if invalid_items == INVALID_PRESERVE:
                     context.collect_waring(error.formatted_message)
-                elif options.invalid_items == options.EXCLUDE:
+                elif invalid_items == INVALID_EXCLUDE:
                     context.collect_waring(error.formatted_message)
                     return unprovided
                 else:
@@ -579,25 +698,41 @@ class FunctionParser(BaseParser):
         # def f(self, data):
         # self.f({})
         # not keyword-only argument may show up at pos args
+        if not args and not self.positional_only_fields:
+            if not kwargs and not self.field_values and not context.options.min_params:
+                # nullary call of a function without params, nothing to validate
+                return (), {}
+            # all passed by keywords (or no params), nothing to parse by position
+            parsed_kwargs = self.parse_data(kwargs, context=context, as_attname=True)
+            context.raise_error()  # raise the parse error before calling the function
+            return (), parsed_kwargs
+
         parsed_args = []
-        parsed_keys = []
+        parsed_keys = set()
+        positional_handlers = self.positional_handlers
+        positional_num = len(positional_handlers)
+        options = context.options
+        pos_var_index = self.pos_var_index if self.pos_var else None
+        position_type = self.position_type
 
         # 1. parse giving args, including the positional args
         for i, arg in enumerate(args):
-            if self.pos_var and i >= self.pos_var_index:
+            if pos_var_index is not None and i >= pos_var_index:
                 # eg. f(a, b, *args): pos_var_index = 2
-                arg = self.parse_pos_type(index=i, value=arg, context=context)
-                if unprovided(arg):
-                    continue
+                if position_type:
+                    arg = self.parse_pos_type(index=i, value=arg, context=context)
+                    if unprovided(arg):
+                        continue
             else:
-                field = self.positional_fields.get(i)
+                handler = positional_handlers[i] if i < positional_num else None
                 # if field not exists, maybe it's a excluded var
-                if field:
-                    if field.is_no_input(arg, options=context.options):
-                        arg = field.get_default(options=context.options)
+                if handler:
+                    is_no_input, get_default, parse_value, attname = handler
+                    if is_no_input(arg, options=options):
+                        arg = get_default(options=options)
                     else:
-                        parsed_keys.append(field.attname)
-                        arg = field.parse_value(arg, context=context)
+                        parsed_keys.add(attname)
+                        arg = parse_value(arg, context=context)
                     if unprovided(arg):
                         # on_error=excluded, or error collected
                         continue
@@ -615,7 +750,7 @@ class FunctionParser(BaseParser):
                 # this position is definitely after parsed_args
                 # because required args is always (we enforce check) ahead of default args
                 parsed_args.append(default)
-            parsed_keys.append(field.attname)  # need to append parsed as well
+            parsed_keys.add(field.attname)  # need to append parsed as well
             # positional only field is excluded no matter the arg is provided or not
 
         parsed_kwargs = self.parse_data(
@@ -637,16 +772,17 @@ class FunctionParser(BaseParser):
             first_reserve = self.first_reserve
         if first_reserve:
             if self.instancemethod or self.classmethod:
-                _self = pop(kwargs, "__self__")
+                _self = kwargs.pop("__self__", None)
                 if self.classmethod:
                     if _self:
                         _ = getattr(_self, "__class__", None)
                     else:
-                        _ = pop(kwargs, "__class__")
+                        _ = kwargs.pop("__class__", None)
                 elif _self:
                     _ = _self
             if args and not _:
-                _, *args = args
+                _ = args[0]
+                args = args[1:]
         if parse_params:
             args, kwargs = self.parse_params(args, kwargs, context=context)
         if first_reserve:
@@ -672,6 +808,9 @@ class FunctionParser(BaseParser):
         return result
 
     def sync_from_generator(self, generator: Generator, context: RuntimeContext):
+        return_type = self.generator_return_type
+        yield_type = self.generator_yield_type
+        send_type = self.generator_send_type
         i = 0
         sent = None
         while True:
@@ -682,34 +821,35 @@ class FunctionParser(BaseParser):
                     item = next(generator)
             except StopIteration as err:
                 result = err.value
-                if result is None or not self.generator_return_type:
+                if result is None or not return_type:
                     # raise the same StopIteration
                     return result
                 try:
-                    result = context.transformer(result, self.generator_return_type)
+                    result = context.transformer(result, return_type)
                 except Exception as e:
                     error = exc.ParseError(
                         item=f"<generator.return>",
                         value=result,
-                        type=self.generator_return_type,
+                        type=return_type,
                         origin_exc=e,
                     )
                     context.handle_error(error, force_raise=True)
                 return result
             else:
-                if inspect.isgenerator(item):
+                # same check as inspect.isgenerator, without the extra call per item
+                if isinstance(item, GeneratorType):
                     generator = item
                     continue
                     # maybe a tail opt generator
 
-                if self.generator_yield_type:
+                if yield_type:
                     try:
-                        item = context.transformer(item, self.generator_yield_type)
+                        item = context.transformer(item, yield_type)
                     except Exception as e:
                         error = exc.ParseError(
                             item=f"<generator.yield[{i}]>",
                             value=item,
-                            type=self.generator_yield_type,
+                            type=yield_type,
                             origin_exc=e,
                         )
                         context.handle_error(error, force_raise=True)
@@ -717,14 +857,14 @@ class FunctionParser(BaseParser):
                 sent = yield item
 
                 if sent is not None:
-                    if self.generator_send_type:
+                    if send_type:
                         try:
-                            sent = context.transformer(sent, self.generator_send_type)
+                            sent = context.transformer(sent, send_type)
                         except Exception as e:
                             error = exc.ParseError(
                                 item=f"<generator.send[{i}]>",
                                 value=sent,
-                                type=self.generator_send_type,
+                                type=send_type,
                                 origin_exc=e,
                             )
                             context.handle_error(error, force_raise=True)
@@ -738,9 +878,11 @@ class FunctionParser(BaseParser):
         parse_result: bool = None,
         eager: bool = False,
     ):
+        make_context = (options or self.options).make_context
+
         @wraps(self.obj)
         def eager_generator(*args, **kwargs) -> Generator:
-            context = (options or self.options).make_context()
+            context = make_context()
             args, kwargs = self.get_params(
                 args,
                 kwargs,
@@ -777,20 +919,22 @@ class FunctionParser(BaseParser):
     async def async_from_generator(
         self, generator: AsyncGenerator, context: RuntimeContext
     ):
+        yield_type = self.generator_yield_type
+        send_type = self.generator_send_type
         i = 0
         async for item in generator:
-            if inspect.isasyncgen(item):
+            if isinstance(item, AsyncGeneratorType):
                 generator = item
                 continue
 
-            if self.generator_yield_type:
+            if yield_type:
                 try:
-                    item = context.transformer(item, self.generator_yield_type)
+                    item = context.transformer(item, yield_type)
                 except Exception as e:
                     error = exc.ParseError(
                         item=f"<asyncgenerator.yield[{i}]>",
                         value=item,
-                        type=self.generator_yield_type,
+                        type=yield_type,
                         origin_exc=e,
                     )
                     context.handle_error(error, force_raise=True)
@@ -798,14 +942,14 @@ class FunctionParser(BaseParser):
             sent = yield item
 
             if sent is not None:
-                if self.generator_send_type:
+                if send_type:
                     try:
-                        sent = context.transformer(sent, self.generator_send_type)
+                        sent = context.transformer(sent, send_type)
                     except Exception as e:
                         error = exc.ParseError(
                             item=f"<asyncgenerator.send[{i}]>",
                             value=sent,
-                            type=self.generator_send_type,
+                            type=send_type,
                             origin_exc=e,
                         )
                         context.handle_error(error, force_raise=True)
@@ -824,9 +968,11 @@ class FunctionParser(BaseParser):
         parse_result: bool = None,
         eager: bool = False,
     ):
+        make_context = (options or self.options).make_context
+
         @wraps(self.obj)
         def eager_generator(*args, **kwargs) -> AsyncGenerator:
-            context = (options or self.options).make_context()
+            context = make_context()
             args, kwargs = self.get_params(
                 args,
                 kwargs,
@@ -864,9 +1010,11 @@ class FunctionParser(BaseParser):
         parse_result: bool = None,
         eager: bool = False,
     ):
+        make_context = (options or self.options).make_context
+
         @wraps(self.obj)
         def eager_call(*args, **kwargs):
-            context = (options or self.options).make_context()
+            context = make_context()
             args, kwargs = self.get_params(
                 args,
                 kwargs,
@@ -932,9 +1080,7 @@ def call(
 
     parser = parser_cls.apply_for(func)  # use the __parser__ if already installed
     options = options or parser.options
-    new_context: RuntimeContext = (options or parser.options).make_context(
-        context=context
-    )
+    new_context: RuntimeContext = options.make_context(context=context)
     transformer = new_context.transformer
 
     args = args or ()
@@ -964,6 +1110,17 @@ def call(
             _data[key] = val
         data = _data
 
+    if not parser.is_asynchronous and not parser.is_generator:
+        # plain sync function: call through the parser directly
+        # instead of building a wrapper closure for a single call
+        return parser.sync_call(
+            tuple(args),
+            dict(data),
+            context=options.make_context(),
+            parse_params=not ignore_params,
+            parse_result=not ignore_result,
+        )
+
     f = parser.wrap(
         options, parse_params=not ignore_params, parse_result=not ignore_result
     )
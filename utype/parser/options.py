@@ -1,4 +1,5 @@
 import inspect
+import sys
 import warnings
 from typing import Any, Callable, List, Optional, Set, Type, Union
 
@@ -19,6 +20,12 @@ DEFAULT_SECRET_NAMES = (
 )
 
 
+def intern_policy(policy):
+    # map a policy string like "exclude" to the interned constant
+    # so comparing with Options.EXCLUDE / PRESERVE / THROW takes the identity fast path
+    return sys.intern(policy) if type(policy) is str else policy
+
+
 class Options:
     # CAMEL_CASE_GENERATOR = AliasGenerator.camel
     # SNAKE_CASE_GENERATOR = AliasGenerator.snake
@@ -171,6 +178,11 @@ class Options:
             # force default implies ignore_required
             ignore_required = True
 
+        invalid_items = intern_policy(invalid_items)
+        invalid_keys = intern_policy(invalid_keys)
+        invalid_values = intern_policy(invalid_values)
+        unresolved_types = intern_policy(unresolved_types)
+
         if not collect_errors:
             if max_errors:
                 warnings.warn(
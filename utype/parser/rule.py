@@ -8,6 +8,7 @@ from enum import Enum, EnumMeta
 from functools import partial
 from typing import (Any, AsyncGenerator, Callable, Dict, Generator, List,
                     Mapping, Optional, Tuple, Type, TypeVar, Union, Iterator)
+from weakref import WeakKeyDictionary
 
 from ..utils import exceptions as exc
 from ..utils.compat import (ForwardRef, Literal, evaluate_forward_ref,
@@ -90,6 +91,10 @@ def register_forward_ref(
     return annotation
 
 
+_combined_origins: "WeakKeyDictionary[type, LogicalType]" = WeakKeyDictionary()
+# cache the combined origin of annotated logical types, shared by all the fields using that type
+
+
 class LogicalType(type):  # noqa
     def __instancecheck__(cls, obj):
         if isinstance(obj, LogicalType):
@@ -141,9 +146,16 @@ class LogicalType(type):  # noqa
     def resolve_combined_origin(cls) -> Optional["LogicalType"]:
         if cls.combinator:
             return cls
+        comb = _combined_origins.get(cls)
+        if comb is not None:
+            return comb
         origin = getattr(cls, "__origin__", None)
         if isinstance(origin, LogicalType):
-            return origin.resolve_combined_origin()
+            comb = origin.resolve_combined_origin()
+            if comb is not None:
+                # only cache the resolved result, the origin may still be an unresolved ForwardRef
+                _combined_origins[cls] = comb
+            return comb
         return None
 
     @classmethod
@@ -267,7 +267,7 @@ class JsonSchemaGenerator:
         if not unprovided(f.field.example):
             data.update(examples=[f.field.example])
         if f.aliases:
-            data.update(aliases=f.aliases)
+            data.update(aliases=set(f.aliases))
         return data
 
     def generate_for_dataclass(self, t):
@@ -73,6 +73,8 @@ class TypeRegistry:
             self._registry.insert(0, (detector, f, priority))
             if priority:
                 self._registry.sort(key=lambda v: -v[2])
+            # resolved types may now resolve to the new one
+            self._cache.clear()
             return f
 
         # before runtime, type will be compiled and applied
@@ -1,6 +1,6 @@
 import decimal
 import uuid
-from collections.abc import Mapping
+from collections.abc import Mapping, MappingView
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 from typing import Union
@@ -8,19 +8,45 @@ from .base import TypeRegistry
 import json
 from .datastructures import unprovided
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 encoder_registry = TypeRegistry('encoder', cache=True, shortcut='__encoder__')
 register_encoder = encoder_registry.register
+# the registry caches the resolved encoders by type (cleared on register)
+resolve_encoder = encoder_registry.resolve
 
 
 class JSONEncoder(json.JSONEncoder):
     def default(self, o):
-        encoder = encoder_registry.resolve(type(o))
+        encoder = resolve_encoder(type(o))
         if encoder:
             return encoder(o)
         return super().default(o)
 
 
+def encode_default(o):
+    encoder = resolve_encoder(type(o))
+    if encoder:
+        return encoder(o)
+    raise TypeError(f'Object of type {o.__class__.__name__} is not JSON serializable')
+
+
+if orjson:
+    # datetime / dataclass are passed through to keep the registered encoders in effect
+    # (eg. time is truncated to milliseconds by from_time)
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+else:
+    ORJSON_OPTIONS = None
+
+
 class JSONSerializer:
     """
     Simple wrapper around json to be used in signing.dumps and
@@ -31,41 +57,80 @@ class JSONSerializer:
     separators = (',', ':')
     ensure_ascii = False
     skipkeys = True
+    # orjson is opt-in: its output differs from json, eg. NaN / Infinity are written as null
+    # (ints over 64 bits or keys it cannot convert fall back to json)
+    prefer_orjson = False
+
+    def get_encoder(self):
+        # reuse the encoder instead of making one per dumps call,
+        # rebuild it if the settings are changed on the instance
+        key = (self.encoder_cls, tuple(self.separators), self.ensure_ascii, self.skipkeys)
+        cached = self.__dict__.get('_encoder')
+        if cached and cached[0] == key:
+            return cached[1]
+        if self.encoder_cls is JSONEncoder:
+            # same dispatch as JSONEncoder.default, passed as a plain function hook
+            encoder = json.JSONEncoder(
+                separators=self.separators,
+                ensure_ascii=self.ensure_ascii,
+                skipkeys=self.skipkeys,
+                default=encode_default,
+            )
+        else:
+            encoder = self.encoder_cls(
+                separators=self.separators,
+                ensure_ascii=self.ensure_ascii,
+                skipkeys=self.skipkeys
+            )
+        self.__dict__['_encoder'] = (key, encoder)
+        return encoder
+
+    def use_orjson(self):
+        # orjson only produces the compact utf-8 output of the default settings
+        return (
+            self.prefer_orjson
+            and orjson is not None
+            and self.encoder_cls is JSONEncoder
+            and self.charset == 'utf-8'
+            and tuple(self.separators) == (',', ':')
+            and not self.ensure_ascii
+        )
 
     def dumps(self, obj):
-        return json.dumps(
-            obj,
-            separators=self.separators,
-            cls=self.encoder_cls,
-            ensure_ascii=self.ensure_ascii,
-            skipkeys=self.skipkeys
-        ).encode(self.charset)
+        if self.prefer_orjson and self.use_orjson():
+            # orjson writes bytes directly, no need to encode
+            try:
+                return orjson.dumps(obj, default=encode_default, option=ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                # eg. int over 64 bits, or a key to skip (skipkeys)
+                pass
+        return self.get_encoder().encode(obj).encode(self.charset)
 
     def loads(self, data: bytes):
+        if self.charset == 'utf-8':
+            # json accepts utf-8 bytes as is
+            # (orjson.loads is not used: it turns big ints into floats and rejects NaN)
+            return json.loads(data)
         return json.loads(data.decode(self.charset))
 
 
+# zero-padded 00 ~ 59, timedelta normalizes seconds to a day so hours < 24 as well
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+
 def duration_iso_string(duration: timedelta):
-    if duration < timedelta(0):
+    if duration.days < 0:
         sign = "-"
-        duration *= -1
+        duration = -duration
     else:
         sign = ""
 
-    days = duration.days
-    seconds = duration.seconds
+    minutes, seconds = divmod(duration.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     microseconds = duration.microseconds
 
-    minutes = seconds // 60
-    seconds = seconds % 60
-
-    hours = minutes // 60
-    minutes = minutes % 60
-
-    ms = ".{:06d}".format(microseconds) if microseconds else ""
-    return "{}P{}DT{:02d}H{:02d}M{:02d}{}S".format(
-        sign, days, hours, minutes, seconds, ms
-    )
+    ms = f".{microseconds:06d}" if microseconds else ""
+    return f"{sign}P{duration.days}DT{_TWO_DIGITS[hours]}H{_TWO_DIGITS[minutes]}M{_TWO_DIGITS[seconds]}{ms}S"
 
 
 @register_encoder(Mapping)
@@ -73,7 +138,7 @@ def from_mapping(data):
     return dict(data)
 
 
-@register_encoder(set)
+@register_encoder(set, frozenset)
 def from_set(data):
     return list(data)
 
@@ -83,6 +148,12 @@ def from_tuple(data):
     return list(data)
 
 
+@register_encoder(MappingView, range)
+def from_sequence_like(data):
+    # dict.keys() / values() / items() and range
+    return list(data)
+
+
 @register_encoder(unprovided.__class__)
 def from_unprovided(data):
     return None
@@ -105,15 +176,16 @@ def from_duration(data: timedelta):
 
 @register_encoder(time)
 def from_time(data: time):
-    r = data.isoformat()
     if data.microsecond:
-        r = r[:12]
-    return r
+        # keep to milliseconds precision
+        return data.isoformat(timespec="milliseconds")
+    return data.isoformat()
 
 
 @register_encoder(uuid.UUID)
 def from_uuid(data: uuid.UUID):
-    return str(data)
+    h = f"{data.int:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 @register_encoder(decimal.Decimal)
@@ -123,7 +195,18 @@ def from_decimal(data: decimal.Decimal):
 
 @register_encoder(Enum)
 def from_enum(en: Enum):
-    return en.value
+    # _value_ is the documented member attribute behind the .value descriptor
+    return en._value_
+
+
+# resolve the builtin types ahead, so the first encoding of them hits the registry cache
+for _t in (
+    set, frozenset, tuple, range,
+    type({}.keys()), type({}.values()), type({}.items()),
+    bytes, datetime, date, time, timedelta,
+    uuid.UUID, decimal.Decimal, unprovided.__class__,
+):
+    resolve_encoder(_t)
 
 
 # @register_encoder(attr="__iter__")
@@ -56,7 +56,16 @@ class ParseError(TypeError, ValueError):
         self.item = item
         self.field = field
         self.routes = routes
-        super().__init__(self.formatted_message)
+        # the message is formatted lazily in __str__, errors that are only
+        # collected as warnings (exclude / preserve) do not pay for it twice
+        # the raw msg is kept in args so the error can be pickled (reconstructed)
+        super().__init__(msg)
+
+    def __str__(self):
+        return str(self.formatted_message)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({repr(str(self))})"
 
     @property
     def formatted_message(self):